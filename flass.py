@@ -3,7 +3,7 @@ Simple Fashion Shop Website using Flask
 --------------------------------------
 Run steps:
 1) pip install flask
-2) python app.py
+2) python play.py shop   (or: python flass.py)
 Open http://127.0.0.1:5000
 
 Features:
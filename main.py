@@ -4,6 +4,7 @@
 import pygame
 import random
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # ---------- Settings ----------
@@ -74,8 +75,14 @@ def save_high_score(score):
         pass
 
 
+@lru_cache(maxsize=None)
+def get_font(size):
+    # loaded on first use and kept, SysFont scans the system fonts and is slow
+    return pygame.font.SysFont(FONT_NAME, size, bold=True)
+
+
 def render_text(surface, text, size, pos, color=TEXT, center=False, shadow=True):
-    font = pygame.font.SysFont(FONT_NAME, size, bold=True)
+    font = get_font(size)
     surf = font.render(text, True, color)
     rect = surf.get_rect()
     if center:
@@ -0,0 +1,717 @@
+# Multiplayer Snake over the local network (asyncio server + pygame clients)
+# The server is authoritative: it runs the tick loop for every snake on one big
+# shared board. Clients only send direction changes (one byte each) and get back
+# compact binary deltas for the area around their own snake.
+#
+#   python multiplayer.py server                 # start the server (no pygame needed)
+#   python multiplayer.py client                 # play (needs pygame)
+#   python multiplayer.py bots --count 50        # headless bot clients for testing
+#   python multiplayer.py bench                  # how many snakes one core can tick
+
+import argparse
+import asyncio
+import random
+import socket
+import struct
+import sys
+import time
+from collections import Counter, defaultdict, deque
+
+# ---------- Settings ----------
+HOST = "127.0.0.1"
+PORT = 8765
+BOARD_CELLS = 128       # 128x128 shared board
+TICK_RATE = 20          # server ticks per second
+VIEW_RADIUS = 12        # clients see a (2R+1) x (2R+1) window around their head
+CHUNK = 16              # size of the buckets used for interest management
+START_LENGTH = 3
+MIN_FOOD = 16
+FOOD_PER_SNAKE = 2
+MAX_SEND_BUFFER = 256 * 1024  # drop clients that stop reading
+
+# Directions (same as main.py), the index is the wire code
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+RESPAWN = 4
+
+# ---------- Wire format ----------
+# Client -> server: single bytes, 0-3 = direction code, 4 = respawn.
+# Server -> client: frames of u32 length + payload, network byte order.
+FRAME = struct.Struct("!I")
+MSG_HELLO = 1
+MSG_TICK = 2
+HELLO = struct.Struct("!BHHHBB")  # type, snake id, board width, board height, view radius, tick rate
+TICK = struct.Struct("!BIBHHHH")  # type, tick, alive, own score, view center x, y, number of events
+
+# Events follow the TICK header. Cells that leave a client's view are simply
+# forgotten by the client, cells that enter it are sent as HEAD/BODY/FOOD.
+EV_HEAD = 1   # snake moved its head onto (x, y)
+EV_BODY = 2   # (x, y) belongs to snake (sent when the cell scrolls into view)
+EV_CLEAR = 3  # (x, y) is empty again (tail moved on, or a dead snake removed)
+EV_FOOD = 4   # food appeared at (x, y)
+SNAKE_EVENT = struct.Struct("!BHHH")  # kind, snake id, x, y
+CELL_EVENT = struct.Struct("!BHH")    # kind, x, y
+CELL_EVENTS = (EV_CLEAR, EV_FOOD)
+
+
+def encode_event(kind, sid, x, y):
+    if kind in CELL_EVENTS:
+        return CELL_EVENT.pack(kind, x, y)
+    return SNAKE_EVENT.pack(kind, sid, x, y)
+
+
+def decode_events(payload, offset, count):
+    events = []
+    for _ in range(count):
+        kind = payload[offset]
+        if kind in CELL_EVENTS:
+            _, x, y = CELL_EVENT.unpack_from(payload, offset)
+            events.append((kind, 0, x, y))
+            offset += CELL_EVENT.size
+        else:
+            events.append(SNAKE_EVENT.unpack_from(payload, offset))
+            offset += SNAKE_EVENT.size
+    return events
+
+
+def frame(payload):
+    return FRAME.pack(len(payload)) + payload
+
+
+class FrameReader:
+    """Splits a byte stream into decoded server messages."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer += data
+        messages = []
+        while len(self.buffer) >= FRAME.size:
+            (length,) = FRAME.unpack_from(self.buffer)
+            end = FRAME.size + length
+            if len(self.buffer) < end:
+                break
+            payload = bytes(self.buffer[FRAME.size:end])
+            del self.buffer[:end]
+            if payload[0] == MSG_HELLO:
+                messages.append(HELLO.unpack(payload))
+            elif payload[0] == MSG_TICK:
+                _, tick, alive, score, x, y, count = TICK.unpack_from(payload)
+                events = decode_events(payload, TICK.size, count)
+                messages.append((MSG_TICK, tick, bool(alive), score, (x, y), events))
+        return messages
+
+
+# ---------- Server side ----------
+class Snake:
+    def __init__(self, sid):
+        self.sid = sid
+        self.cells = deque()  # head first
+        self.direction = RIGHT
+        self.pending = RIGHT  # buffer to avoid instant reverse within same tick
+        self.alive = False
+        self.score = 0
+
+
+class World:
+    """The shared board. Pure simulation, knows nothing about sockets."""
+
+    def __init__(self, size=BOARD_CELLS, rng=None):
+        self.size = size
+        self.rng = rng or random.Random()
+        self.tick = 0
+        self.snakes = {}
+        self.cells = {}   # (x, y) -> snake id
+        self.food = set()
+        self.events = []  # (kind, snake id, x, y) since the last flush
+        self.next_sid = 1
+
+    def random_empty_cell(self):
+        """A random free cell, or None when the board is full."""
+        for _ in range(100):
+            cell = (self.rng.randrange(self.size), self.rng.randrange(self.size))
+            if cell not in self.cells and cell not in self.food:
+                return cell
+        # crowded board, pick from the cells that are actually free
+        free = [(x, y) for x in range(self.size) for y in range(self.size)
+                if (x, y) not in self.cells and (x, y) not in self.food]
+        return self.rng.choice(free) if free else None
+
+    def spawn(self):
+        if len(self.snakes) >= 0xFFFF:
+            raise RuntimeError("no free snake ids")
+        while self.next_sid in self.snakes:  # ids wrap around after 0xFFFF
+            self.next_sid = self.next_sid % 0xFFFF + 1
+        snake = Snake(self.next_sid)
+        self.next_sid = self.next_sid % 0xFFFF + 1
+        self.snakes[snake.sid] = snake
+        self.respawn(snake)
+        return snake
+
+    def respawn(self, snake):
+        """Place the snake on the board. It stays dead if there is no room."""
+        for _ in range(1000):
+            cell = self.random_empty_cell()
+            if cell is None:
+                return False
+            x, y = cell
+            # leave some room in front, the snake starts moving right
+            if x < START_LENGTH - 1 or x > self.size - 4:
+                continue
+            cells = [(x - i, y) for i in range(START_LENGTH)]
+            if any(cell in self.cells or cell in self.food for cell in cells):
+                continue
+            snake.cells = deque(cells)
+            snake.direction = snake.pending = RIGHT
+            snake.alive = True
+            snake.score = 0
+            # all BODY: the head gets its HEAD event when the snake first moves
+            for cell in reversed(cells):
+                self.cells[cell] = snake.sid
+                self.events.append((EV_BODY, snake.sid) + cell)
+            return True
+        return False
+
+    def kill(self, snake):
+        for cell in snake.cells:
+            del self.cells[cell]
+            self.events.append((EV_CLEAR, 0) + cell)
+        snake.alive = False
+
+    def remove(self, snake):
+        if snake.alive:
+            self.kill(snake)
+        del self.snakes[snake.sid]
+
+    def steer(self, snake, code):
+        if not snake.alive:
+            if code == RESPAWN:
+                self.respawn(snake)
+        elif code < len(DIRECTIONS):
+            direction = DIRECTIONS[code]
+            if direction != OPPOSITE[snake.direction]:
+                snake.pending = direction
+
+    def step(self):
+        self.tick += 1
+        moves = {}
+        for snake in self.snakes.values():
+            if snake.alive:
+                snake.direction = snake.pending
+                head_x, head_y = snake.cells[0]
+                dx, dy = snake.direction
+                moves[snake] = (head_x + dx, head_y + dy)
+
+        # Collisions are checked against the board before anyone moves, like
+        # in main.py. Two heads entering the same cell both die.
+        targets = Counter(moves.values())
+        dying = [snake for snake, (x, y) in moves.items()
+                 if not (0 <= x < self.size and 0 <= y < self.size)
+                 or (x, y) in self.cells or targets[(x, y)] > 1]
+        for snake in dying:
+            self.kill(snake)
+            del moves[snake]
+
+        for snake, new_head in moves.items():
+            snake.cells.appendleft(new_head)
+            self.cells[new_head] = snake.sid
+            self.events.append((EV_HEAD, snake.sid) + new_head)
+            if new_head in self.food:
+                self.food.remove(new_head)
+                snake.score += 1
+            else:
+                tail = snake.cells.pop()
+                del self.cells[tail]
+                self.events.append((EV_CLEAR, 0) + tail)
+
+        wanted = max(MIN_FOOD, FOOD_PER_SNAKE * len(moves))
+        while len(self.food) < wanted:
+            cell = self.random_empty_cell()
+            if cell is None:
+                break
+            self.food.add(cell)
+            self.events.append((EV_FOOD, 0) + cell)
+
+    def flush(self):
+        events, self.events = self.events, []
+        return events
+
+
+class Player:
+    """A snake plus what its client currently knows about the board."""
+
+    def __init__(self, snake, send):
+        self.snake = snake
+        self.send = send
+        self.center = None
+        self.view = None  # rectangle the client was last brought up to date on
+
+
+def view_rect(center, radius, size):
+    x, y = center
+    return (max(x - radius, 0), max(y - radius, 0),
+            min(x + radius, size - 1), min(y + radius, size - 1))
+
+
+def in_rect(rect, x, y):
+    return rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]
+
+
+def exposed_cells(rect, old):
+    """Cells inside rect that were not inside old (all of rect if old is None)."""
+    x0, y0, x1, y1 = rect
+    full = range(y0, y1 + 1)
+    if old is None:
+        ox0, ox1, rows = x1 + 1, x1, ()
+    else:
+        ox0, oy0, ox1, oy1 = old
+        rows = [*range(y0, min(y1, oy0 - 1) + 1), *range(max(y0, oy1 + 1), y1 + 1)]
+    for x in range(x0, x1 + 1):
+        for y in rows if ox0 <= x <= ox1 else full:
+            yield x, y
+
+
+def bucket_events(events):
+    """Encode each event once and group them by board chunk."""
+    buckets = defaultdict(list)
+    for kind, sid, x, y in events:
+        buckets[(x // CHUNK, y // CHUNK)].append((x, y, encode_event(kind, sid, x, y)))
+    return buckets
+
+
+def build_frame(world, player, buckets, radius=VIEW_RADIUS):
+    snake = player.snake
+    if snake.alive or player.center is None:
+        # a snake that never found room has no cells yet, show the middle
+        player.center = snake.cells[0] if snake.cells else (world.size // 2, world.size // 2)
+    rect = view_rect(player.center, radius, world.size)
+    old = player.view
+    parts = []
+
+    # Deltas for cells the client already knew about: the overlap of the old
+    # and the new view, looked up through the chunks it touches.
+    if old is not None:
+        kx0, ky0 = max(rect[0], old[0]), max(rect[1], old[1])
+        kx1, ky1 = min(rect[2], old[2]), min(rect[3], old[3])
+        for cx in range(kx0 // CHUNK, kx1 // CHUNK + 1):
+            for cy in range(ky0 // CHUNK, ky1 // CHUNK + 1):
+                for x, y, data in buckets.get((cx, cy), ()):
+                    if kx0 <= x <= kx1 and ky0 <= y <= ky1:
+                        parts.append(data)
+
+    # Current contents of cells that just scrolled into view.
+    cells, food = world.cells, world.food
+    for cell in exposed_cells(rect, old):
+        sid = cells.get(cell)
+        if sid is not None:
+            kind = EV_HEAD if world.snakes[sid].cells[0] == cell else EV_BODY
+            parts.append(encode_event(kind, sid, *cell))
+        elif cell in food:
+            parts.append(encode_event(EV_FOOD, 0, *cell))
+
+    player.view = rect
+    header = TICK.pack(MSG_TICK, world.tick & 0xFFFFFFFF, snake.alive,
+                       min(snake.score, 0xFFFF), *player.center, len(parts))
+    return frame(header + b"".join(parts))
+
+
+class Server:
+    def __init__(self, world=None, tick_rate=TICK_RATE, radius=VIEW_RADIUS):
+        self.world = world or World()
+        self.tick_rate = tick_rate
+        self.radius = radius
+        self.players = {}
+        self.tick_times = deque(maxlen=tick_rate * 5)
+        self.bytes_sent = 0
+
+    async def handle(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def send(data):
+            if writer.transport.get_write_buffer_size() > MAX_SEND_BUFFER:
+                writer.transport.abort()
+            else:
+                writer.write(data)
+
+        try:
+            snake = self.world.spawn()
+        except RuntimeError:  # no free snake ids
+            writer.close()
+            return
+        self.players[snake.sid] = Player(snake, send)
+        send(frame(HELLO.pack(MSG_HELLO, snake.sid, self.world.size, self.world.size,
+                              self.radius, self.tick_rate)))
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                for code in data:
+                    self.world.steer(snake, code)
+        except ConnectionError:
+            pass
+        finally:
+            del self.players[snake.sid]
+            self.world.remove(snake)
+            writer.close()
+
+    def tick(self):
+        started = time.perf_counter()
+        self.world.step()
+        buckets = bucket_events(self.world.flush())
+        for player in list(self.players.values()):
+            data = build_frame(self.world, player, buckets, self.radius)
+            self.bytes_sent += len(data)
+            player.send(data)
+        self.tick_times.append(time.perf_counter() - started)
+
+    async def run(self, host=HOST, port=PORT, log=True):
+        server = await asyncio.start_server(self.handle, host, port)
+        if log:
+            print(f"Snake server on {host}:{port} - board {self.world.size}x{self.world.size}, "
+                  f"{self.tick_rate} ticks/sec")
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        async with server:
+            while True:
+                self.tick()
+                if log and self.world.tick % (self.tick_rate * 5) == 0:
+                    avg = sum(self.tick_times) / len(self.tick_times) * 1000
+                    print(f"tick {self.world.tick}: {len(self.players)} players, {avg:.2f} ms/tick")
+                next_tick += interval
+                delay = next_tick - loop.time()
+                if delay < 0:
+                    next_tick = loop.time()  # running behind, don't try to catch up
+                await asyncio.sleep(max(delay, 0))
+
+
+# ---------- Client side ----------
+class View:
+    """What a client knows: the cells around its own snake."""
+
+    def __init__(self, sid, width, height, radius):
+        self.sid = sid
+        self.width = width
+        self.height = height
+        self.radius = radius
+        self.cells = {}   # (x, y) -> snake id
+        self.heads = {}   # snake id -> (x, y)
+        self.food = set()
+        self.center = None  # set by the first TICK
+        self.alive = True
+        self.score = 0
+        self.tick = 0
+
+    def apply(self, tick, alive, score, center, events):
+        self.tick = tick
+        self.alive = alive
+        self.score = score
+        self.center = center
+        # Every live snake moves each tick, so a head we got no HEAD event
+        # for has either died or moved out of view.
+        self.heads = {}
+        for kind, sid, x, y in events:
+            cell = (x, y)
+            if kind == EV_HEAD:
+                self.cells[cell] = sid
+                self.heads[sid] = cell
+                self.food.discard(cell)
+            elif kind == EV_BODY:
+                self.cells[cell] = sid
+                self.food.discard(cell)
+            elif kind == EV_CLEAR:
+                self.cells.pop(cell, None)
+            elif kind == EV_FOOD:
+                self.food.add(cell)
+        self.forget_outside_view()
+
+    def forget_outside_view(self):
+        rect = view_rect(self.center, self.radius, self.width)
+        self.cells = {cell: sid for cell, sid in self.cells.items() if in_rect(rect, *cell)}
+        self.heads = {sid: cell for sid, cell in self.heads.items() if in_rect(rect, *cell)}
+        self.food = {cell for cell in self.food if in_rect(rect, *cell)}
+
+    def is_free(self, cell):
+        x, y = cell
+        return 0 <= x < self.width and 0 <= y < self.height and cell not in self.cells
+
+
+def choose_direction(view, rng):
+    """Simple bot: head for the nearest visible food without hitting anything."""
+    head_x, head_y = view.center
+    options = []
+    for code, (dx, dy) in enumerate(DIRECTIONS):
+        cell = (head_x + dx, head_y + dy)
+        if view.is_free(cell):
+            options.append((code, cell))
+    if not options:
+        return rng.randrange(len(DIRECTIONS))
+    if view.food and rng.random() > 0.05:
+        target = min(view.food, key=lambda f: abs(f[0] - head_x) + abs(f[1] - head_y))
+        return min(options, key=lambda o: (abs(o[1][0] - target[0]) + abs(o[1][1] - target[1]),
+                                           rng.random()))[0]
+    return rng.choice(options)[0]
+
+
+async def run_bot(host, port, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    frames = FrameReader()
+    view = None
+    last_code = None
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for message in frames.feed(data):
+                if message[0] == MSG_HELLO:
+                    view = View(*message[1:5])
+                else:
+                    view.apply(*message[1:])
+            if view is None or view.center is None:
+                continue
+            if not view.alive:
+                writer.write(bytes([RESPAWN]))
+                last_code = None
+                continue
+            code = choose_direction(view, rng)
+            if code != last_code:  # only send direction changes
+                writer.write(bytes([code]))
+                last_code = code
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_bots(host, port, count, seed=None):
+    rng = random.Random(seed)
+    bots = []
+    for i in range(count):
+        bots.append(asyncio.create_task(run_bot(host, port, random.Random(rng.random()))))
+        await asyncio.sleep(0.01)  # don't hit the server with all connects at once
+        if bots[-1].done():
+            bots[-1].result()  # stop early if e.g. there is no server
+    print(f"{count} bots connected to {host}:{port}")
+    await asyncio.gather(*bots)
+
+
+def run_client(host, port):
+    import pygame
+    from main import (BG, GRID, SNAKE_HEAD, SNAKE_BODY, FOOD, CELL_SIZE,
+                      draw_rect, render_text)
+
+    other_head = (90, 140, 230)
+    other_body = (70, 110, 190)
+    wall = (48, 40, 44)
+
+    sock = socket.create_connection((host, port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setblocking(False)
+    frames = FrameReader()
+    view = None
+
+    keys = {
+        pygame.K_UP: 0, pygame.K_w: 0,
+        pygame.K_DOWN: 1, pygame.K_s: 1,
+        pygame.K_LEFT: 2, pygame.K_a: 2,
+        pygame.K_RIGHT: 3, pygame.K_d: 3,
+        pygame.K_r: RESPAWN,
+    }
+
+    pygame.init()
+    clock = pygame.time.Clock()
+    screen = None
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                pygame.quit()
+                sock.close()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN and event.key in keys:
+                try:
+                    sock.send(bytes([keys[event.key]]))
+                except BlockingIOError:
+                    pass  # send buffer full, drop this keypress
+                except ConnectionError:
+                    pygame.quit()
+                    sys.exit("Server closed the connection")
+
+        try:
+            data = sock.recv(65536)
+        except BlockingIOError:
+            data = None
+        except ConnectionError:
+            data = b""
+        if data == b"":
+            pygame.quit()
+            sys.exit("Server closed the connection")
+        if data:
+            for message in frames.feed(data):
+                if message[0] == MSG_HELLO:
+                    view = View(*message[1:5])
+                    size = (2 * view.radius + 1) * CELL_SIZE
+                    screen = pygame.display.set_mode((size, size))
+                    pygame.display.set_caption("Snake - Multiplayer")
+                else:
+                    view.apply(*message[1:])
+
+        if view is None or view.center is None:
+            clock.tick(60)
+            continue
+
+        # --- Draw the window around our own head ---
+        screen.fill(BG)
+        cx, cy = view.center
+        r = view.radius
+        size = (2 * r + 1) * CELL_SIZE
+        for i in range(2 * r + 1):
+            pygame.draw.line(screen, GRID, (i * CELL_SIZE, 0), (i * CELL_SIZE, size))
+            pygame.draw.line(screen, GRID, (0, i * CELL_SIZE), (size, i * CELL_SIZE))
+        for sx in range(2 * r + 1):
+            for sy in range(2 * r + 1):
+                x, y = cx - r + sx, cy - r + sy
+                if not (0 <= x < view.width and 0 <= y < view.height):
+                    draw_rect(screen, wall, (sx, sy), radius=2)
+        for (x, y), sid in view.cells.items():
+            own = sid == view.sid
+            if view.heads.get(sid) == (x, y):
+                color, radius = (SNAKE_HEAD if own else other_head), 8
+            else:
+                color, radius = (SNAKE_BODY if own else other_body), 6
+            draw_rect(screen, color, (x - cx + r, y - cy + r), radius=radius)
+        for x, y in view.food:
+            draw_rect(screen, FOOD, (x - cx + r, y - cy + r), radius=10)
+
+        render_text(screen, f"Score: {view.score}", 22, (10, 8))
+        render_text(screen, "Arrows/WASD to move | R: Respawn | Esc: Quit", 18, (10, size - 28))
+        if not view.alive:
+            render_text(screen, "GAME OVER", 56, (size // 2, size // 2 - 40), center=True)
+            render_text(screen, "Press R to Respawn", 28, (size // 2, size // 2 + 10), center=True)
+
+        pygame.display.flip()
+        clock.tick(60)
+
+
+# ---------- Benchmark ----------
+async def benchmark(counts, board=BOARD_CELLS, seconds=5, tick_rate=TICK_RATE,
+                    port=PORT, bot_processes=4):
+    """Run the real Server in this process with localhost bots in separate
+    processes, and see how many snakes it keeps up with at tick_rate.
+    CPU time covers everything the server process does: ticks, socket writes,
+    reading input and the asyncio loop itself."""
+    budget = 1000 / tick_rate
+    server = Server(World(board), tick_rate)
+    runner = asyncio.create_task(server.run(HOST, port, log=False))
+    await asyncio.sleep(0.2)
+    best = 0
+    print(f"board {board}x{board}, {tick_rate} ticks/sec, {budget:.0f} ms budget per tick")
+    print(f"{'snakes':>7} {'tick ms':>8} {'p95 ms':>8} {'cpu ms':>8} {'ticks/s':>8} {'bytes/client':>13}")
+    try:
+        for count in counts:
+            procs = []
+            for i in range(bot_processes):
+                n = count // bot_processes + (i < count % bot_processes)
+                if n:
+                    procs.append(await asyncio.create_subprocess_exec(
+                        sys.executable, __file__, "bots", "--port", str(port),
+                        "--count", str(n), "--seed", str(i), stdout=asyncio.subprocess.DEVNULL))
+            deadline = time.perf_counter() + 30 + count * 0.02
+            while len(server.players) < count:
+                if runner.done():
+                    runner.result()
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"only {len(server.players)} of {count} bots connected")
+                await asyncio.sleep(0.1)
+            await asyncio.sleep(1)  # let the bots settle in
+
+            ticks = seconds * tick_rate
+            server.tick_times = deque(maxlen=ticks)
+            server.bytes_sent = 0
+            first_tick = server.world.tick
+            cpu, wall = time.process_time(), time.perf_counter()
+            await asyncio.sleep(seconds)
+            ticks = server.world.tick - first_tick
+            cpu_ms = (time.process_time() - cpu) / ticks * 1000
+            rate = ticks / (time.perf_counter() - wall)
+
+            for proc in procs:
+                proc.terminate()
+                await proc.wait()
+            while server.players:
+                await asyncio.sleep(0.1)
+
+            times = sorted(server.tick_times)
+            avg = sum(times) / len(times) * 1000
+            p95 = times[int(len(times) * 0.95)] * 1000
+            print(f"{count:>7} {avg:>8.2f} {p95:>8.2f} {cpu_ms:>8.2f} {rate:>8.1f} "
+                  f"{server.bytes_sent / ticks / count:>13.0f}")
+            if cpu_ms > budget or rate < tick_rate * 0.95:
+                break
+            best = count
+        else:
+            print(f"One core keeps up with at least {best} snakes at {tick_rate} ticks/sec "
+                  f"(never ran over budget, try higher --counts).")
+            return
+        print(f"One core keeps up with about {best} snakes at {tick_rate} ticks/sec.")
+    finally:
+        runner.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multiplayer Snake over the local network.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    server = commands.add_parser("server", help="run the authoritative game server")
+    server.add_argument("--host", default=HOST)
+    server.add_argument("--port", type=int, default=PORT)
+    server.add_argument("--board", type=int, default=BOARD_CELLS, help="board size in cells")
+    server.add_argument("--tick-rate", type=int, default=TICK_RATE)
+
+    client = commands.add_parser("client", help="play with pygame")
+    client.add_argument("--host", default=HOST)
+    client.add_argument("--port", type=int, default=PORT)
+
+    bots = commands.add_parser("bots", help="connect headless bot clients")
+    bots.add_argument("--host", default=HOST)
+    bots.add_argument("--port", type=int, default=PORT)
+    bots.add_argument("--count", type=int, default=20)
+    bots.add_argument("--seed", type=int)
+
+    bench = commands.add_parser("bench", help="measure snakes per core with localhost bots")
+    bench.add_argument("--counts", default="50,100,200,400,800,1600",
+                       help="comma separated snake counts to try")
+    bench.add_argument("--board", type=int, default=BOARD_CELLS, help="board size in cells")
+    bench.add_argument("--seconds", type=int, default=5, help="measuring time per count")
+    bench.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    bench.add_argument("--port", type=int, default=PORT)
+    bench.add_argument("--bot-processes", type=int, default=4)
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "server":
+            asyncio.run(Server(World(args.board), args.tick_rate).run(args.host, args.port))
+        elif args.command == "client":
+            run_client(args.host, args.port)
+        elif args.command == "bots":
+            asyncio.run(run_bots(args.host, args.port, args.count, args.seed))
+        elif args.command == "bench":
+            asyncio.run(benchmark([int(n) for n in args.counts.split(",")], args.board,
+                                  args.seconds, args.tick_rate, args.port, args.bot_processes))
+    except ConnectionRefusedError:
+        sys.exit(f"No snake server running on {getattr(args, 'host', HOST)}:{args.port}")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Game kiosk launcher: one entry point for the games and the shop
+#
+#   python play.py                       # pick from a menu
+#   python play.py snake
+#   python play.py runner
+#   python play.py multiplayer server    # any multiplayer.py arguments
+#   python play.py shop --port 5000
+#   python play.py --startup-profile snake
+#
+# Only the module for the chosen command is imported, so the menu comes up
+# right away and the shop never loads pygame (nor the games Flask).
+
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+
+# command: (module, description)
+COMMANDS = {
+    "snake": ("main", "Snake"),
+    "runner": ("temple_game", "Temple Run style infinite runner"),
+    "multiplayer": ("multiplayer", "Multiplayer snake over the local network"),
+    "shop": ("flass", "Fashion shop website"),
+}
+PYGAME_COMMANDS = ("snake", "runner")
+# mode: description, for picking multiplayer from the menu
+MULTIPLAYER_MODES = {
+    "client": "Join a game (pygame)",
+    "server": "Host a game on this machine",
+    "bots": "Add bot players to a running server",
+}
+
+
+class StartupProfile:
+    """Collects how long each import/init step took and prints it to stderr."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.steps = [("launcher", time.perf_counter() - _STARTED)]
+
+    def run(self, label, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.steps.append((label, time.perf_counter() - started))
+        return result
+
+    def report(self):
+        if not self.enabled:
+            return
+        for label, seconds in self.steps:
+            print(f"startup: {label:<22} {seconds * 1000:8.1f} ms", file=sys.stderr)
+        total = sum(seconds for _, seconds in self.steps)
+        print(f"startup: {'total':<22} {total * 1000:8.1f} ms", file=sys.stderr)
+        loaded = [name for name in ("pygame", "flask") if name in sys.modules]
+        print(f"startup: loaded {', '.join(loaded) or 'no pygame/flask'}", file=sys.stderr)
+
+
+def load(args, profile):
+    command = args.command
+    module_name = COMMANDS[command][0]
+    if command in PYGAME_COMMANDS or (command == "multiplayer" and args.args[:1] == ["client"]):
+        pygame = profile.run("import pygame", importlib.import_module, "pygame")
+        module = profile.run(f"import {module_name}", importlib.import_module, module_name)
+        profile.run("pygame.init()", pygame.init)
+    elif command == "shop":
+        profile.run("import flask", importlib.import_module, "flask")
+        module = profile.run(f"import {module_name}", importlib.import_module, module_name)
+    else:
+        module = profile.run(f"import {module_name}", importlib.import_module, module_name)
+    return module
+
+
+def ask(prompt, choices):
+    names = list(choices)
+    print(prompt)
+    for i, name in enumerate(names, 1):
+        print(f"  {i}) {name:<12} {choices[name]}")
+    while True:
+        try:
+            choice = input("> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            sys.exit()
+        if choice in names:
+            return choice
+        if choice.isdigit() and 1 <= int(choice) <= len(names):
+            return names[int(choice) - 1]
+        print(f"Type a number from 1 to {len(names)}.")
+
+
+def menu():
+    """Ask what to start, returns the command line for it."""
+    command = ask("Choose a game:", {name: info[1] for name, info in COMMANDS.items()})
+    if command == "multiplayer":
+        return [command, ask("Multiplayer mode:", MULTIPLAYER_MODES)]
+    return [command]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launch one of the games or the shop.")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print import and init times before starting")
+    commands = parser.add_subparsers(dest="command")
+    for name, (_, description) in COMMANDS.items():
+        sub = commands.add_parser(name, help=description)
+        if name == "multiplayer":
+            sub.add_argument("args", nargs=argparse.REMAINDER, help="arguments for multiplayer.py")
+        elif name == "shop":
+            sub.add_argument("--host", default="127.0.0.1")
+            sub.add_argument("--port", type=int, default=5000)
+            sub.add_argument("--debug", action="store_true")
+
+    args = parser.parse_args(argv)
+    # created before the menu, so time spent at the prompt is not counted
+    profile = StartupProfile(args.startup_profile)
+    if args.command is None:
+        args = parser.parse_args(menu())
+
+    module = load(args, profile)
+    profile.report()
+
+    if args.command == "multiplayer":
+        module.main(args.args)
+    elif args.command == "shop":
+        module.app.run(host=args.host, port=args.port, debug=args.debug)
+    else:
+        module.main()
+
+
+if __name__ == "__main__":
+    main()
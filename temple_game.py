@@ -4,6 +4,7 @@
 import pygame
 import random
 import sys
+from functools import lru_cache
 
 # --- Game Settings ---
 WIDTH, HEIGHT = 800, 400
@@ -17,11 +18,12 @@ PLAYER_COLOR = (0, 200, 255)
 OBSTACLE_COLOR = (255, 80, 80)
 TEXT_COLOR = (240, 240, 240)
 
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Temple Run Style Game - Python")
-clock = pygame.time.Clock()
-font = pygame.font.SysFont("consolas", 30, bold=True)
+
+@lru_cache(maxsize=None)
+def get_font():
+    # created on first use, pygame.init() has to run first
+    return pygame.font.SysFont("consolas", 30, bold=True)
+
 
 # --- Player ---
 class Player:
@@ -45,7 +47,7 @@ class Player:
             self.vel_y = 0
             self.on_ground = True
 
-    def draw(self):
+    def draw(self, screen):
         pygame.draw.rect(screen, PLAYER_COLOR, (self.x, self.y, self.width, self.height), border_radius=8)
 
     def get_rect(self):
@@ -63,7 +65,7 @@ class Obstacle:
     def update(self):
         self.x -= self.speed
 
-    def draw(self):
+    def draw(self, screen):
         pygame.draw.rect(screen, OBSTACLE_COLOR, (self.x, self.y, self.width, self.height), border_radius=4)
 
     def off_screen(self):
@@ -74,6 +76,15 @@ class Obstacle:
 
 # --- Game Loop ---
 def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Temple Run Style Game - Python")
+    clock = pygame.time.Clock()
+    run(screen, clock)
+
+
+def run(screen, clock):
+    font = get_font()
     player = Player()
     obstacles = []
     score = 0
@@ -96,7 +107,7 @@ def main():
                         player.jump()
                 else:
                     if event.key == pygame.K_r:
-                        return main()  # restart game
+                        return run(screen, clock)  # restart game
 
         # --- Update ---
         if alive:
@@ -120,9 +131,9 @@ def main():
         # ground line
         pygame.draw.line(screen, (200, 200, 200), (0, HEIGHT - 40), (WIDTH, HEIGHT - 40), 3)
 
-        player.draw()
+        player.draw(screen)
         for obs in obstacles:
-            obs.draw()
+            obs.draw(screen)
 
         # Score
         score_text = font.render(f"Score: {score}", True, TEXT_COLOR)
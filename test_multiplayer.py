@@ -0,0 +1,98 @@
+import random
+from collections import deque
+
+import pytest
+
+import multiplayer as mp
+
+
+def place(world, sid, cells, direction):
+    snake = mp.Snake(sid)
+    snake.cells = deque(cells)
+    snake.direction = snake.pending = direction
+    snake.alive = True
+    world.snakes[sid] = snake
+    for cell in cells:
+        world.cells[cell] = sid
+    return snake
+
+
+@pytest.mark.parametrize("a_first", [True, False])
+def test_head_on_swap_kills_both(a_first):
+    world = mp.World(16, random.Random(0))
+    specs = [
+        (1, [(5, 5), (4, 5), (3, 5)], mp.RIGHT),
+        (2, [(6, 5), (7, 5), (8, 5)], mp.LEFT),
+    ]
+    if not a_first:
+        specs.reverse()
+    a, b = sorted((place(world, *spec) for spec in specs), key=lambda s: s.sid)
+    world.step()
+    assert not a.alive and not b.alive
+    assert world.cells == {}
+
+
+@pytest.mark.parametrize("a_first", [True, False])
+def test_two_heads_into_same_cell_both_die(a_first):
+    world = mp.World(16, random.Random(0))
+    specs = [
+        (1, [(5, 5), (4, 5), (3, 5)], mp.RIGHT),
+        (2, [(7, 5), (8, 5), (9, 5)], mp.LEFT),
+    ]
+    if not a_first:
+        specs.reverse()
+    a, b = sorted((place(world, *spec) for spec in specs), key=lambda s: s.sid)
+    world.step()
+    assert not a.alive and not b.alive
+    assert (6, 5) not in world.cells
+
+
+def test_spawn_skips_ids_in_use_after_wraparound():
+    world = mp.World(64, random.Random(0))
+    first = world.spawn()
+    world.next_sid = 0xFFFF
+    last = world.spawn()
+    wrapped = world.spawn()
+    assert (first.sid, last.sid, wrapped.sid) == (1, 0xFFFF, 2)
+    assert world.snakes[1] is first
+
+
+def test_full_board_leaves_snake_dead():
+    world = mp.World(5, random.Random(0))
+    world.food = {(x, y) for x in range(5) for y in range(5)}
+    assert world.random_empty_cell() is None
+    snake = world.spawn()
+    assert not snake.alive
+    world.step()
+    world.steer(snake, mp.RESPAWN)
+    assert not snake.alive
+    player = mp.Player(snake, None)
+    mp.build_frame(world, player, mp.bucket_events(world.flush()))
+
+
+def test_client_view_matches_server_board():
+    size = 64
+    world = mp.World(size, random.Random(3))
+    players = [mp.Player(world.spawn(), None) for _ in range(40)]
+    views = [mp.View(p.snake.sid, size, size, mp.VIEW_RADIUS) for p in players]
+    rng = random.Random(2)
+
+    for _ in range(300):
+        world.step()
+        buckets = mp.bucket_events(world.flush())
+        for player, view in zip(players, views):
+            (message,) = mp.FrameReader().feed(mp.build_frame(world, player, buckets))
+            view.apply(*message[1:])
+
+            rect = mp.view_rect(view.center, view.radius, size)
+            assert view.alive == player.snake.alive
+            assert view.cells == {c: s for c, s in world.cells.items() if mp.in_rect(rect, *c)}
+            assert view.food == {c for c in world.food if mp.in_rect(rect, *c)}
+            assert view.heads == {s.sid: s.cells[0] for s in world.snakes.values()
+                                  if s.alive and mp.in_rect(rect, *s.cells[0])}
+
+        for player, view in zip(players, views):
+            if player.snake.alive:
+                world.steer(player.snake, mp.choose_direction(view, rng))
+            else:
+                world.steer(player.snake, mp.RESPAWN)